@@ -1,16 +1,68 @@
 from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
+from operator import attrgetter
+import functools
 import hashlib
+import itertools
+import re
+import threading
 
+import numpy as np
+
+
+app = FastAPI(title = "String Analyzer", default_response_class=ORJSONResponse)
+
+# One analyzed string as held in memory. string_lower, has_vowel and
+# char_mask are only used for filtering and are left out of API responses.
+# char_mask has bit n set when chr(n) (ASCII only) occurs in string_lower.
+# seq is the insertion sequence number that list endpoints order by.
+@dataclass(slots=True)
+class Record:
+    id: str
+    string: str
+    string_lower: str
+    length: int
+    is_palindrome: bool
+    unique_characters: int
+    word_count: int
+    sha256_hash: str
+    character_frequency_map: Dict[str, int]
+    has_vowel: bool
+    char_mask: int
+    created_at: datetime
+    seq: int = 0
 
-app = FastAPI(title = "String Analyzer")
 
 # In-memory storage (simulating a database)
-analysis_db: Dict[str, dict] = {}
+analysis_db: Dict[str, Record] = {}
 # string_id = 0
 
+# Sync endpoints run in FastAPI's threadpool, so every write to analysis_db
+# and its indexes happens under this lock. Readers never take it: they work
+# on C-level copies or column snapshots and skip ids that have gone missing.
+db_lock = threading.Lock()
+insertion_counter = itertools.count()
+
+# string value -> id, for lookups by value
+value_index: Dict[str, str] = {}
+
+# Secondary indexes over analysis_db (values are sets of string ids)
+LENGTH_BUCKET_SIZE = 16
+palindrome_index: Set[str] = set()
+by_word_count: Dict[int, Set[str]] = {}
+by_length_bucket: Dict[int, Set[str]] = {}
+
+VECTORIZE_THRESHOLD = 256
+
+# letters checked for the has_vowel flag
+VOWELS = frozenset("aeiou")
+VOWEL_MASK = sum(1 << ord(vowel) for vowel in VOWELS)
+
 class String_to_analyze(BaseModel):
     text: str
 
@@ -25,74 +77,313 @@ def sha_encoder(text:str):
     sha_id = str(sha256_hash.hexdigest())
     return sha_id 
 
-# palindrome logic
-def is_palindrome(text:str):
-    return text.lower() == text.lower()[::-1]
-
-# word count logic
-def word_count(text:str): 
-    return len(text.split())
-
-# unique characters
-def unique_chars(text):
-    return len(set(text))
-
-# create instance of character frequency
-def count_char_frequency_dict(text):
-    frequency = {}
-    for char in text:
-        if char in frequency:
-            frequency[char] += 1
-        else:
-            frequency[char] = 1
-    return frequency
-
-
-def analyze_string_properties(text: str):
+# palindrome check for text that is already lowercased
+def is_lowered_palindrome(lowered:str):
+    # most strings are not palindromes - bail out before copying the reverse
+    if lowered and lowered[0] != lowered[-1]:
+        return False
+    return lowered == lowered[::-1]
+
+# bitmap of the lowercase ASCII characters in the text, built from the
+# distinct characters of its frequency map
+def ascii_char_mask(frequency):
+    mask = 0
+    for char in frequency:
+        for lower_char in char.lower():
+            code = ord(lower_char)
+            if code < 128:
+                mask |= 1 << code
+    return mask
+
+
+def analyze_string_properties(text: str) -> Record:
     """
-    Analyzes a string and returns a dictionary of its properties.
+    Analyzes a string and returns a Record of its properties.
     The SHA256 hash is used as a unique ID for each string.
     """
     # Get the current time in UTC - ISO 8601 format
     now_utc = datetime.now(timezone.utc)
 
-    # sha_id
+    # sha_id - computed once, also reused for the sha256_hash property
     text_id = sha_encoder(text)
 
+    # single pass over the text for the frequency map and unique count;
+    # one lowercase copy shared by the palindrome and contains checks
+    frequency = dict(Counter(text))
+    lowered = text.lower()
+    char_mask = ascii_char_mask(frequency)
+
+    return Record(
+        id=text_id,
+        string=text,
+        string_lower=lowered,
+        length=len(text),
+        is_palindrome=is_lowered_palindrome(lowered),
+        unique_characters=len(frequency),
+        word_count=len(text.split()),
+        sha256_hash=text_id,
+        character_frequency_map=frequency,
+        has_vowel=bool(char_mask & VOWEL_MASK),
+        char_mask=char_mask,
+        created_at=now_utc,
+    )
+
+
+# shape returned by the API
+def record_to_dict(record: Record) -> dict:
     properties = {
-        "length": len(text),
-        "is_palindrome": is_palindrome(text),
-        "unique_characters": unique_chars(text),
-        "word_count": word_count(text),
-        "sha256_hash": sha_encoder(text),
-        "character_frequency_map": count_char_frequency_dict(text)
-        # "contains_character": 'a' in text.lower()
-        # "contains_vowel_a": 'a' in text.lower(),
-        # "contains_char_z": 'z' in text.lower()
-        }
-    created_at = now_utc    
-
-    return {"string": text, "id": text_id, "properties": properties, "created at": created_at}
+        "length": record.length,
+        "is_palindrome": record.is_palindrome,
+        "unique_characters": record.unique_characters,
+        "word_count": record.word_count,
+        "sha256_hash": record.sha256_hash,
+        "character_frequency_map": record.character_frequency_map,
+    }
+    return {"string": record.string, "id": record.id, "properties": properties, "created at": record.created_at}
+
+
+class PropertyColumns:
+    """
+    NumPy column copies of the filterable properties, in insertion order.
+    Rows are appended in place (capacity doubles when full) and deleted rows
+    are tombstoned, then compacted once they make up half of the rows.
+    Writers must hold db_lock. Readers take `view` once and only look at the
+    first `size` rows of those arrays, which writers never change except to
+    tombstone them.
+    """
+    FIELDS = (
+        ("length", np.int64),
+        ("word_count", np.int64),
+        ("is_palindrome", bool),
+        ("has_vowel", bool),
+    )
+
+    def __init__(self):
+        self.rows: Dict[str, int] = {}
+        self.dead = 0
+        self.view: Tuple[Dict[str, np.ndarray], int] = (self.allocate(VECTORIZE_THRESHOLD), 0)
+
+    @classmethod
+    def allocate(cls, capacity: int) -> Dict[str, np.ndarray]:
+        arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in cls.FIELDS}
+        arrays["id"] = np.empty(capacity, dtype=object)
+        arrays["alive"] = np.zeros(capacity, dtype=bool)
+        return arrays
+
+    def append(self, record: Record):
+        arrays, size = self.view
+        if size == len(arrays["id"]):
+            grown = self.allocate(2 * size)
+            for name, column in arrays.items():
+                grown[name][:size] = column
+            arrays = grown
+
+        for name, _ in self.FIELDS:
+            arrays[name][size] = getattr(record, name)
+        arrays["id"][size] = record.id
+        arrays["alive"][size] = True
+
+        self.rows[record.id] = size
+        # publish the new row in a single assignment
+        self.view = (arrays, size + 1)
+
+    def remove(self, text_id: str):
+        row = self.rows.pop(text_id, None)
+        if row is None:
+            return
+        arrays, size = self.view
+        arrays["alive"][row] = False
+        self.dead += 1
+        if self.dead * 2 >= size:
+            self.compact()
+
+    def compact(self):
+        arrays, size = self.view
+        keep = arrays["alive"][:size]
+        live = int(keep.sum())
+        compacted = self.allocate(max(VECTORIZE_THRESHOLD, 2 * live))
+        for name, column in arrays.items():
+            compacted[name][:live] = column[:size][keep]
+        self.rows = {text_id: row for row, text_id in enumerate(compacted["id"][:live])}
+        self.dead = 0
+        self.view = (compacted, live)
+
+
+columns = PropertyColumns()
+
+
+# keep the secondary indexes in sync with analysis_db (caller holds db_lock)
+def index_record(record: Record):
+    text_id = record.id
+    columns.append(record)
+    value_index[record.string] = text_id
+    if record.is_palindrome:
+        palindrome_index.add(text_id)
+    by_word_count.setdefault(record.word_count, set()).add(text_id)
+    bucket = record.length // LENGTH_BUCKET_SIZE
+    by_length_bucket.setdefault(bucket, set()).add(text_id)
+
+
+def unindex_record(record: Record):
+    text_id = record.id
+    columns.remove(text_id)
+    value_index.pop(record.string, None)
+    palindrome_index.discard(text_id)
+    for index, key in (
+        (by_word_count, record.word_count),
+        (by_length_bucket, record.length // LENGTH_BUCKET_SIZE),
+    ):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(text_id)
+            if not ids:
+                del index[key]
+
+
+def index_candidates(
+    is_palindrome: Optional[bool] = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    word_count: Optional[int] = None,
+) -> Optional[List[Set[str]]]:
+    """
+    Picks the most selective secondary index for the filters and returns the
+    id sets it points at, without merging them. Returns None when no index
+    helps. Length buckets are coarse, so callers still have to check the
+    exact bounds.
+    """
+    options = []
+
+    if is_palindrome:
+        options.append([palindrome_index])
+    if word_count is not None:
+        ids = by_word_count.get(word_count)
+        options.append([ids] if ids else [])
+    if min_length is not None or max_length is not None:
+        low = (min_length or 0) // LENGTH_BUCKET_SIZE
+        high = None if max_length is None else max_length // LENGTH_BUCKET_SIZE
+        buckets = [
+            ids for bucket, ids in list(by_length_bucket.items())
+            if bucket >= low and (high is None or bucket <= high)
+        ]
+        # a range covering most of the records is cheaper to scan
+        if sum(map(len, buckets)) * 2 < len(analysis_db):
+            options.append(buckets)
+
+    if not options:
+        return None
+    return min(options, key=lambda id_sets: sum(map(len, id_sets)))
+
+
+def vectorized_matches(
+    is_palindrome: Optional[bool] = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    word_count: Optional[int] = None,
+    has_vowel: Optional[bool] = None,
+) -> List[Record]:
+    """
+    Evaluates the column filters as one boolean mask over every record.
+    """
+    arrays, size = columns.view
+    mask = arrays["alive"][:size].copy()
+
+    if word_count is not None:
+        mask &= arrays["word_count"][:size] == word_count
+    if is_palindrome is not None:
+        mask &= arrays["is_palindrome"][:size] == is_palindrome
+    if has_vowel is not None:
+        mask &= arrays["has_vowel"][:size] == has_vowel
+    if min_length is not None:
+        mask &= arrays["length"][:size] >= min_length
+    if max_length is not None:
+        mask &= arrays["length"][:size] <= max_length
+
+    # rows deleted since the snapshot was taken are skipped
+    matches = map(analysis_db.get, arrays["id"][:size][mask])
+    return [record for record in matches if record is not None]
+
+
+def filter_records(
+    is_palindrome: Optional[bool] = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    word_count: Optional[int] = None,
+    contains_character: Optional[str] = None,
+    has_vowel: Optional[bool] = None,
+) -> List[Record]:
+    """
+    Returns the stored records matching every filter that is not None.
+    contains_character is matched case-insensitively.
+    """
+    # a single ASCII character is answered from char_mask; anything else
+    # falls back to a substring search
+    char_bit = 0
+    if contains_character is not None:
+        contains_character = contains_character.lower()
+        if len(contains_character) == 1 and ord(contains_character) < 128:
+            char_bit = 1 << ord(contains_character)
+
+    # choose the access path from the index sizes before building any set
+    id_sets = index_candidates(is_palindrome, min_length, max_length, word_count)
+    if id_sets is None:
+        estimate = len(analysis_db)
+    else:
+        estimate = sum(map(len, id_sets))
+
+    if estimate >= VECTORIZE_THRESHOLD:
+        # the indexes do not narrow things down much - mask the columns instead;
+        # the survivors only still need the substring check
+        matches = vectorized_matches(is_palindrome, min_length, max_length, word_count, has_vowel)
+        if contains_character is None:
+            return matches
+        if char_bit:
+            return [r for r in matches if r.char_mask & char_bit]
+        return [r for r in matches if contains_character in r.string_lower]
+
+    if id_sets is None:
+        # below VECTORIZE_THRESHOLD records; copy so concurrent writes
+        # cannot change the dict while it is being iterated
+        records = list(analysis_db.values())
+    else:
+        candidates = set().union(*id_sets)
+        records = [r for r in map(analysis_db.get, candidates) if r is not None]
+        # set order is arbitrary; the other paths return insertion order
+        records.sort(key=attrgetter("seq"))
+
+    # single pass, cheapest and most selective checks first
+    return [
+        r for r in records
+        if (word_count is None or r.word_count == word_count)
+        and (is_palindrome is None or r.is_palindrome == is_palindrome)
+        and (has_vowel is None or r.has_vowel == has_vowel)
+        and (min_length is None or r.length >= min_length)
+        and (max_length is None or r.length <= max_length)
+        and (
+            contains_character is None
+            or (r.char_mask & char_bit if char_bit else contains_character in r.string_lower)
+        )
+    ]
+
 
 @app.post("/strings")
 def check_string(payload: String_to_analyze):
     
     text = payload.text
-    # Accepts a string and returns string properties
-    data = analyze_string_properties(text)
-
-    id = data["id"]
-
-    # analysis_db[string_id]
 
     # Error catchers 409, 400 and 422
-    if id in analysis_db:
+    # duplicates are caught through the value index before any analysis
+    if text in value_index:
         raise HTTPException(
             status_code=409,
             detail="String already exists in the system"
         )
-    
-    
+
+    # Accepts a string and returns string properties
+    record = analyze_string_properties(text)
+
+    id = record.id
+
     if id is None:
         raise HTTPException(
             status_code=400,
@@ -105,26 +396,54 @@ def check_string(payload: String_to_analyze):
             status_code=422,
             detail="Invalid data type for 'value' (must be string)"
         )
-    analysis_db[id] = data
-    return data
+    with db_lock:
+        # a concurrent POST of the same text may have won the race
+        if text in value_index:
+            raise HTTPException(
+                status_code=409,
+                detail="String already exists in the system"
+            )
+        record.seq = next(insertion_counter)
+        analysis_db[id] = record
+        index_record(record)
+    return record_to_dict(record)
 
 
 # --------------------------
+# every supported query phrase in one pattern, compiled once at import;
+# the contains branch only looks ahead for its token so phrases after it
+# are still matched. Negated vowel phrases ("does not contain a vowel")
+# match neither the vowel branch nor the contains branch.
+NL_QUERY_RE = re.compile(
+    r"(?P<palindrome>palindrome)"
+    r"|(?P<single_word>single word|one word)"
+    r"|(?<!not )(?<!n't )(?P<vowel>contains?\s+(?:a|any)\s+vowels?\b)"
+    r"|contains(?!\s+(?:a|any)\s+vowel)(?=\s*(?P<token>\S+))"
+)
+
+
 def parse_natural_language_query(query: str) -> dict:
-    query = query.lower()
+    # normalize here so equivalent queries share one cache slot
+    return dict(parse_normalized_query(query.strip().lower()))
+
+# Cached per normalized query; returns (key, value) pairs so the cached
+# object is immutable and safe to share between requests.
+@functools.lru_cache(maxsize=512)
+def parse_normalized_query(query: str) -> Tuple[tuple, ...]:
     filters = {}
 
-    if "palindrome" in query:
-        filters["is_palindrome"] = True
-    if "single word" in query or "one word" in query:
-        filters["word_count"] = 1
-    if "contains" in query:
-        parts = query.split("contains")
-        if len(parts) > 1:
-            char = parts[1].strip().split()[0]
-            filters["contains_character"] = char
+    for match in NL_QUERY_RE.finditer(query):
+        phrase = match.lastgroup
+        if phrase == "palindrome":
+            filters["is_palindrome"] = True
+        elif phrase == "single_word":
+            filters["word_count"] = 1
+        elif phrase == "vowel":
+            filters["has_vowel"] = True
+        elif "contains_character" not in filters:
+            filters["contains_character"] = match.group("token")
 
-    return filters
+    return tuple(filters.items())
 
 
     
@@ -143,20 +462,7 @@ async def filter_by_natural_language(query: str = Query(..., description="Natura
             detail="Query parsed but resulted in conflicting filters"
         )
 
-    results = list(analysis_db.values())
-
-    if "is_palindrome" in filters:
-        results = [s for s in results if s["properties"]["is_palindrome"] == filters["is_palindrome"]]
-    if "word_count" in filters:
-        results = [s for s in results if s["properties"]["word_count"] == filters["word_count"]]
-    if "contains_character" in filters:
-        results = [s for s in results if filters["contains_character"] in s["string"]]
-    if "min_length" in filters:
-        results = [s for s in results if s["properties"]["length"] >= filters["min_length"]]
-    if "max_length" in filters:
-        results = [s for s in results if s["properties"]["length"] <= filters["max_length"]]
-
-    return results
+    return [record_to_dict(r) for r in filter_records(**filters)]
 
 
 
@@ -169,17 +475,13 @@ async def filter_by_natural_language(query: str = Query(..., description="Natura
 @app.get("/strings/{string_value}")
 async def get_string(string_value:str):
     
-     # Get the current time in UTC - ISO 8601 format
-    # now_utc = datetime.now(timezone.utc)
-
-    for data in analysis_db.values():
-
-        if data["string"] == string_value:
-
-            return data
-    else:
+    # a concurrent delete can remove the record after the index lookup
+    record = analysis_db.get(value_index.get(string_value))
+    if record is None:
         raise HTTPException(status_code=404, detail="String does not exist in the system")
 
+    return record_to_dict(record)
+
 
 
 @app.get("/strings")
@@ -197,27 +499,19 @@ def get_all_strings_with_filters(
             detail="min_length cannot be greater than max_length"
         )
 
-    results = list(analysis_db.values())
-
-    if is_palindrome is not None:
-        results = [s for s in results if s["properties"]["is_palindrome"] == is_palindrome]
-    if min_length is not None:
-        results = [s for s in results if s["properties"]["length"] >= min_length]
-    if max_length is not None:
-        results = [s for s in results if s["properties"]["length"] <= max_length]
-    if word_count is not None:
-        results = [s for s in results if s["properties"]["word_count"] == word_count]
-    if contains_character is not None:
-        results = [s for s in results if contains_character.lower() in s["string"].lower()]
-
-    return results
+    results = filter_records(is_palindrome, min_length, max_length, word_count, contains_character)
+    return [record_to_dict(r) for r in results]
 
 
 @app.delete("/strings/{string_value}", status_code=204)
 def delete_string(string_value:str):
     
-    if string_value in analysis_db:
-        del analysis_db[string_value]
+    with db_lock:
+        record = analysis_db.pop(string_value, None)
+        if record is not None:
+            unindex_record(record)
+
+    if record is not None:
         return Response(status_code=204)
     else:
         raise HTTPException(